@@ -1,5 +1,9 @@
 """Script to add monitor user and African facilities to the database."""
+import csv
+import io
+
 import psycopg2
+from psycopg2.extras import execute_values
 from werkzeug.security import generate_password_hash
 
 # Connect to the database
@@ -9,29 +13,33 @@ conn = psycopg2.connect(
     user="hfrat_user",
     password="0000"
 )
-conn.autocommit = True
 cur = conn.cursor()
 
-print("=" * 70)
-print("Adding Monitor User")
-print("=" * 70)
+# Seed lists at least this long are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 1000
+
+
+def copy_facilities(cur, rows):
+    """Bulk load facilities via COPY into a temp table, skipping duplicates."""
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
 
-# Check if monitor already exists
-cur.execute("SELECT id FROM users WHERE email = 'monitor@hfrat.com'")
-if cur.fetchone():
-    print("Monitor user already exists!")
-else:
-    password_hash = generate_password_hash("Monitor@2026!")
     cur.execute("""
-        INSERT INTO users (email, password_hash, role, created_at, updated_at)
-        VALUES (%s, %s, %s, NOW(), NOW())
-    """, ('monitor@hfrat.com', password_hash, 'MONITOR'))
-    print("✅ Monitor user created: monitor@hfrat.com / Monitor@2026!")
+        CREATE TEMP TABLE tmp_facilities (
+            name VARCHAR(150), country VARCHAR(120), city VARCHAR(120)
+        ) ON COMMIT DROP
+    """)
+    cur.copy_expert(
+        "COPY tmp_facilities (name, country, city) FROM STDIN WITH (FORMAT csv)",
+        buf,
+    )
+    cur.execute("""
+        INSERT INTO facilities (name, country, city, created_at)
+        SELECT name, country, city, NOW() FROM tmp_facilities
+        ON CONFLICT (name) DO NOTHING
+    """)
 
-print()
-print("=" * 70)
-print("Adding African Facilities")
-print("=" * 70)
 
 african_facilities = [
     ("Kenyatta National Hospital", "Kenya", "Nairobi"),
@@ -46,18 +54,67 @@ african_facilities = [
     ("Groote Schuur Hospital", "South Africa", "Cape Town"),
 ]
 
-for name, country, city in african_facilities:
-    # Check if facility already exists
-    cur.execute("SELECT id FROM facilities WHERE name = %s", (name,))
+# Run all inserts in a single transaction so the WAL is flushed once
+try:
+    print("=" * 70)
+    print("Adding Monitor User")
+    print("=" * 70)
+
+    # One lookup decides whether the monitor needs creating; the unique index on
+    # email still guards against a concurrent insert.
+    cur.execute("SELECT 1 FROM users WHERE email = %s",
+                ('monitor@hfrat.com',))
     if cur.fetchone():
-        print(f"  ⚠️  {name} already exists")
+        print("Monitor user already exists!")
     else:
+        # Reduced PBKDF2 iterations: this is a dev-only seed account
+        password_hash = generate_password_hash(
+            "Monitor@2026!", method="pbkdf2:sha256:10000")
         cur.execute("""
+            INSERT INTO users (email, password_hash, role, created_at, updated_at)
+            VALUES (%s, %s, %s, NOW(), NOW())
+            ON CONFLICT (email) DO NOTHING
+        """, ('monitor@hfrat.com', password_hash, 'MONITOR'))
+        print("✅ Monitor user created: monitor@hfrat.com / Monitor@2026!")
+
+    print()
+    print("=" * 70)
+    print("Adding African Facilities")
+    print("=" * 70)
+
+    # Fetch the existing names in one query, then insert only the missing rows
+    cur.execute("SELECT name FROM facilities WHERE name = ANY(%s)",
+                ([name for name, _, _ in african_facilities],))
+    existing = {row[0] for row in cur.fetchall()}
+    missing = [row for row in african_facilities if row[0] not in existing]
+
+    for name in sorted(existing):
+        print(f"  ⚠️  {name} already exists")
+
+    if len(missing) >= COPY_THRESHOLD:
+        copy_facilities(cur, missing)
+    elif missing:
+        execute_values(
+            cur,
+            """
             INSERT INTO facilities (name, country, city, created_at)
-            VALUES (%s, %s, %s, NOW())
-        """, (name, country, city))
+            VALUES %s
+            ON CONFLICT (name) DO NOTHING
+            """,
+            missing,
+            template="(%s, %s, %s, NOW())",
+            page_size=1000,
+        )
+    for name, country, city in missing:
         print(f"  ✅ Added: {name} ({city}, {country})")
 
+    conn.commit()
+except Exception:
+    conn.rollback()
+    cur.close()
+    conn.close()
+    raise
+
 print()
 print("=" * 70)
 print("Current Database Summary")
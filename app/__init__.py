@@ -1,17 +1,42 @@
 """Flask application factory."""
 import logging
 import os
+import time
 from logging.handlers import RotatingFileHandler
 
-from flask import Flask, jsonify, request
+import orjson
+from flask import Flask, Response, jsonify, request
 from flask_jwt_extended.exceptions import JWTExtendedException
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import HTTPException
 
 from .config import config_by_name
-from .extensions import cors, db, jwt, migrate
+from .extensions import cors, db, jwt, migrate, token_blocklist
 from .routes import register_blueprints
-from .seed import register_seed_commands
+from .seed import init_database, register_seed_commands
+from .utils.serializers import OrjsonProvider
+
+# Built once so the health probe reuses the same statement object
+_SELECT_ONE = db.text("SELECT 1")
+# Seconds a database probe result is reused by /health
+HEALTH_CHECK_TTL = 5
+
+_SECURITY_HEADERS = (
+    # Prevent clickjacking
+    ("X-Frame-Options", "DENY"),
+    # Prevent MIME type sniffing
+    ("X-Content-Type-Options", "nosniff"),
+    # Enable XSS protection
+    ("X-XSS-Protection", "1; mode=block"),
+    # Content Security Policy
+    ("Content-Security-Policy", "default-src 'self'"),
+    # Referrer policy
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    # Permissions policy
+    ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+)
+_HSTS_HEADER = ("Strict-Transport-Security",
+                "max-age=31536000; includeSubDomains")
 
 
 def create_app(config_name: str | None = None) -> Flask:
@@ -22,19 +47,15 @@ def create_app(config_name: str | None = None) -> Flask:
     app.config.from_object(config_by_name.get(
         env, config_by_name["development"]))
 
-    # Initialize extensions
-    # Build allowed origins list - always include Netlify and localhost
-    allowed_origins = set(app.config.get("CORS_ORIGINS", []))
-    allowed_origins.update({
-        "https://hfrat.netlify.app",
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://localhost:5174",
-    })
+    # orjson-backed jsonify/get_json; Flask 3 no longer reads JSON_SORT_KEYS
+    app.json = OrjsonProvider(app)
+    app.json.sort_keys = app.config["JSON_SORT_KEYS"]
 
+    # Initialize extensions
+    # CORS_ORIGINS already includes Netlify and localhost (see config.py)
     cors.init_app(app, resources={
         r"/api/*": {
-            "origins": list(allowed_origins),
+            "origins": app.config["CORS_ORIGINS"],
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
             "allow_headers": ["Content-Type", "Authorization"],
             "expose_headers": ["Content-Type", "Authorization"],
@@ -45,23 +66,19 @@ def create_app(config_name: str | None = None) -> Flask:
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
-
-    # Auto-create tables on startup (for Render free tier without shell access)
-    try:
-        with app.app_context():
-            db.create_all()
-            # Auto-seed admin if not exists
-            from .models import User
-            admin = User.query.filter_by(email="admin@example.com").first()
-            if not admin:
-                admin = User(email="admin@example.com", role="admin")
-                admin.set_password("Admin@123")
-                db.session.add(admin)
-                db.session.commit()
-                app.logger.info(
-                    "Created default admin user: admin@example.com")
-    except Exception as e:
-        app.logger.error(f"Database initialization error: {e}")
+    token_blocklist.init_app(app)
+
+    # Auto-create tables and the default admin on startup (for Render free
+    # tier without shell access or a pre-deploy step). Hosts that can run
+    # `flask --app run db-init` once per deploy (Heroku release phase via
+    # the Procfile, Render's pre-deploy command) set RUN_DB_INIT=0 so
+    # workers skip it on boot.
+    if os.getenv("RUN_DB_INIT", "1") == "1":
+        try:
+            with app.app_context():
+                init_database(app)
+        except Exception as e:
+            app.logger.error(f"Database initialization error: {e}")
 
     # Configure logging
     configure_logging(app)
@@ -74,37 +91,49 @@ def create_app(config_name: str | None = None) -> Flask:
     register_shellcontext(app)
     register_seed_commands(app)
 
+    # Both bodies are fixed between probes, so they are encoded once and
+    # served as raw bytes.
+    index_body = orjson.dumps({
+        "name": "HFRAT API",
+        "version": "1.0.0",
+        "status": "running",
+        "environment": env,
+        "endpoints": {
+            "auth": "/api/auth",
+            "admin": "/api/admin",
+            "reporter": "/api/reporter",
+            "monitor": "/api/monitor",
+            "health": "/health"
+        }
+    })
+
     @app.get("/")
     def index():
-        return {
-            "name": "HFRAT API",
-            "version": "1.0.0",
-            "status": "running",
-            "environment": env,
-            "endpoints": {
-                "auth": "/api/auth",
-                "admin": "/api/admin",
-                "reporter": "/api/reporter",
-                "monitor": "/api/monitor",
-                "health": "/health"
-            }
-        }
+        return Response(index_body, mimetype="application/json")
+
+    # Last database probe, reused for HEALTH_CHECK_TTL seconds so frequent
+    # uptime polling doesn't cost a round trip per hit.
+    last_health = {"ts": float("-inf"), "body": b""}
 
     @app.get("/health")
     def health_check():
-        try:
-            # Test database connection
-            db.session.execute(db.text("SELECT 1"))
-            db_status = "connected"
-        except Exception as e:
-            db_status = f"error: {str(e)}"
-
-        return {
-            "status": "ok",
-            "environment": env,
-            "database": db_status,
-            "cors_origins": app.config.get("CORS_ORIGINS", [])
-        }
+        now = time.monotonic()
+        if now - last_health["ts"] >= HEALTH_CHECK_TTL:
+            try:
+                # Test database connection
+                db.session.execute(_SELECT_ONE)
+                db_status = "connected"
+            except Exception as e:
+                db_status = f"error: {str(e)}"
+            last_health["body"] = orjson.dumps({
+                "status": "ok",
+                "environment": env,
+                "database": db_status,
+                "cors_origins": app.config.get("CORS_ORIGINS", [])
+            })
+            last_health["ts"] = now
+
+        return Response(last_health["body"], mimetype="application/json")
 
     return app
 
@@ -135,31 +164,26 @@ def configure_logging(app: Flask) -> None:
 
 def register_security_middleware(app: Flask) -> None:
     """Register middleware for security headers."""
+    # Built once per app; each response just appends the prepared pairs.
+    security_headers = list(_SECURITY_HEADERS)
+    # Enforce HTTPS (only in production)
+    if not app.debug:
+        security_headers.append(_HSTS_HEADER)
+
     @app.after_request
     def add_security_headers(response):
         """Add security headers to all responses."""
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        # Enable XSS protection
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        # Enforce HTTPS (only in production)
-        if not app.debug:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        # Content Security Policy
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        # Permissions policy
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-
+        response.headers.extend(security_headers)
         return response
 
+    # Request logging is production-only; skip the hook entirely in debug.
+    if app.debug:
+        return
+
     @app.before_request
     def log_request_info():
         """Log incoming request information."""
-        if not app.debug:
+        if app.logger.isEnabledFor(logging.INFO):
             app.logger.info(
                 "Request: %s %s - IP: %s - User-Agent: %s",
                 request.method,
@@ -7,8 +7,13 @@ from datetime import timedelta
 from typing import Iterable, List
 
 from dotenv import load_dotenv
+from sqlalchemy.pool import StaticPool
 
-load_dotenv()
+# Load the project's .env directly instead of letting python-dotenv search
+# for it; skipped when absent or when FLASK_SKIP_DOTENV=1 (as Flask's CLI does).
+_DOTENV_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
+if os.getenv("FLASK_SKIP_DOTENV") != "1" and os.path.exists(_DOTENV_PATH):
+    load_dotenv(_DOTENV_PATH)
 
 
 def _csv_env(name: str, default: Iterable[str]) -> List[str]:
@@ -18,6 +23,20 @@ def _csv_env(name: str, default: Iterable[str]) -> List[str]:
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
+# Frontend origins that are always allowed, in addition to configured ones
+_DEFAULT_CORS_ORIGINS = (
+    "https://hfrat.netlify.app",
+    "http://localhost:3000",
+    "http://localhost:5173",
+    "http://localhost:5174",
+)
+
+
+def _with_default_origins(origins: Iterable[str]) -> List[str]:
+    # dict.fromkeys de-duplicates while keeping the configured order first
+    return list(dict.fromkeys([*origins, *_DEFAULT_CORS_ORIGINS]))
+
+
 def _secret_env(name: str) -> str:
     value = os.getenv(name)
     if value:
@@ -39,21 +58,38 @@ class Config:
     SECRET_KEY = _secret_env("SECRET_KEY")
     SQLALCHEMY_DATABASE_URI = _get_database_url()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Keep warm connections around and drop ones the server closed while idle
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_timeout": 30,
+    }
     JWT_SECRET_KEY = _secret_env("JWT_SECRET_KEY")
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
+    # None hashes passwords with argon2; a werkzeug method string overrides it
+    PASSWORD_HASH_METHOD = None
+    # Hash method for the bootstrap admin; None keeps it on argon2
+    SEED_PASSWORD_HASH_METHOD = None
+    # Shared store for revoked tokens; falls back to in-process memory if unset
+    REDIS_URL = os.getenv("REDIS_URL")
     JSON_SORT_KEYS = False
     PROPAGATE_EXCEPTIONS = True
 
     # CORS: Allow multiple origins via environment variable
     # Example: CORS_ALLOWED_ORIGINS=https://myapp.netlify.app,https://myapp.vercel.app
-    CORS_ORIGINS = _csv_env(
+    # The Netlify frontend and local dev servers are always included.
+    CORS_ORIGINS = _with_default_origins(_csv_env(
         "CORS_ALLOWED_ORIGINS",
         ["http://localhost:3000", "http://localhost:5173", "http://localhost:5174"],
-    )
+    ))
 
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    # Reduced PBKDF2 cost for the well-known local bootstrap password
+    SEED_PASSWORD_HASH_METHOD = "pbkdf2:sha256:10000"
 
 
 class ProductionConfig(Config):
@@ -66,8 +102,16 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # Share the single in-memory connection across threads
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
-    CORS_ORIGINS = ["http://localhost:3000"]
+    # Single-iteration PBKDF2 keeps the test suite from being bound on hashing
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+    SEED_PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+    CORS_ORIGINS = _with_default_origins(["http://localhost:3000"])
 
 
 config_by_name = {
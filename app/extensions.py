@@ -1,22 +1,64 @@
 """Flask extension instances."""
-import json
+import orjson
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 
 
+class TokenBlocklist:
+    """Revoked JWT ids, stored in Redis when REDIS_URL is configured.
+
+    Entries expire with the token, so the blocklist prunes itself and is
+    shared by every worker. Without Redis an in-process set is used, which
+    is only suitable for development and tests.
+    """
+
+    def init_app(self, app):
+        # Per-app state, looked up through current_app like other extensions
+        redis_url = app.config.get("REDIS_URL")
+        client = None
+        if redis_url:
+            import redis
+
+            client = redis.Redis.from_url(redis_url)
+        app.extensions["token_blocklist"] = {
+            "redis": client,
+            "ttl": app.config["JWT_ACCESS_TOKEN_EXPIRES"],
+            "local": set(),
+        }
+
+    @staticmethod
+    def _state() -> dict:
+        return current_app.extensions["token_blocklist"]
+
+    def add(self, jti: str) -> None:
+        state = self._state()
+        if state["redis"] is not None:
+            state["redis"].setex(f"revoked:{jti}", state["ttl"], 1)
+        else:
+            state["local"].add(jti)
+
+    def __contains__(self, jti: str) -> bool:
+        state = self._state()
+        if state["redis"] is not None:
+            return bool(state["redis"].exists(f"revoked:{jti}"))
+        return jti in state["local"]
+
+
 db = SQLAlchemy()
 migrate = Migrate()
 jwt = JWTManager()
 cors = CORS()
+token_blocklist = TokenBlocklist()
 
 
 @jwt.user_identity_loader
 def user_identity_lookup(user_data):
     """Convert user dict to JSON string for JWT identity."""
     if isinstance(user_data, dict):
-        return json.dumps(user_data)
+        return orjson.dumps(user_data).decode()
     return str(user_data)
 
 
@@ -25,6 +67,6 @@ def user_lookup_callback(_jwt_header, jwt_data):
     """Load user from JWT identity."""
     identity = jwt_data["sub"]
     try:
-        return json.loads(identity) if isinstance(identity, str) else identity
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(identity) if isinstance(identity, str) else identity
+    except (orjson.JSONDecodeError, TypeError):
         return {"id": identity, "role": None, "facility_id": None}
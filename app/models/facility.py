@@ -11,8 +11,8 @@ class Facility(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(150), nullable=False, unique=True, index=True)
-    country = db.Column(db.String(120), nullable=True, index=True)
-    city = db.Column(db.String(120), nullable=True, index=True)
+    country = db.Column(db.String(120), nullable=True)
+    city = db.Column(db.String(120), nullable=True)
     created_at = db.Column(
         db.DateTime, default=datetime.utcnow, nullable=False)
 
@@ -10,8 +10,9 @@ class ResourceReport(db.Model):
     __tablename__ = "resource_reports"
 
     id = db.Column(db.Integer, primary_key=True)
+    # Indexed through uq_reports_facility_id
     facility_id = db.Column(db.Integer, db.ForeignKey(
-        "facilities.id"), nullable=False, index=True)
+        "facilities.id"), nullable=False)
     icu_beds_available = db.Column(db.Integer, nullable=False, default=0)
     ventilators_available = db.Column(db.Integer, nullable=False, default=0)
     staff_on_duty = db.Column(db.Integer, nullable=False, default=0)
@@ -27,6 +28,9 @@ class ResourceReport(db.Model):
                            name="ck_reports_ventilators_non_negative"),
         db.CheckConstraint("staff_on_duty >= 0",
                            name="ck_reports_staff_non_negative"),
+        # One snapshot row per facility; create_report upserts on it and
+        # its index serves every facility_id lookup
+        db.UniqueConstraint("facility_id", name="uq_reports_facility_id"),
     )
 
     def to_dict(self) -> dict:
@@ -3,10 +3,25 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from flask import current_app
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from ..extensions import db
 
+# argon2id with explicit cost; hashes are self-describing ("$argon2id$...")
+_password_hasher = PasswordHasher(
+    time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
+
+def hash_password(raw_password: str, method: str | None = None) -> str:
+    """Hash a password with argon2id, or with a werkzeug ``method`` if given."""
+    if method:
+        return generate_password_hash(raw_password, method=method)
+    return _password_hasher.hash(raw_password)
+
 
 class UserRole(str, Enum):
     ADMIN = "admin"
@@ -38,9 +53,17 @@ class User(db.Model):
     )
 
     def set_password(self, raw_password: str) -> None:
-        self.password_hash = generate_password_hash(raw_password)
+        # PASSWORD_HASH_METHOD selects a cheap werkzeug method for tests.
+        self.password_hash = hash_password(
+            raw_password, current_app.config.get("PASSWORD_HASH_METHOD"))
 
     def check_password(self, raw_password: str) -> bool:
+        if self.password_hash.startswith("$argon2"):
+            try:
+                return _password_hasher.verify(self.password_hash, raw_password)
+            except (VerificationError, InvalidHashError):
+                return False
+        # Legacy werkzeug (pbkdf2/scrypt) hashes
         return check_password_hash(self.password_hash, raw_password)
 
     def to_dict(self) -> dict:
@@ -1,10 +1,13 @@
 """Admin-only routes."""
 from flask import Blueprint, jsonify, request
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
 
 from ..extensions import db
 from ..models import Facility, User, UserRole
+from ..utils.cache import bump_reports_version
 from ..utils.decorators import admin_required
+from ..utils.serializers import serialize_rows
 from ..utils.validators import (
     sanitize_email,
     sanitize_integer,
@@ -14,12 +17,21 @@ from ..utils.validators import (
 
 admin_bp = Blueprint("admin", __name__)
 
+# Fields exposed by the list endpoints (same keys as the models' to_dict)
+_USER_FIELDS = ("id", "email", "role", "facility_id", "created_at", "updated_at")
+_FACILITY_FIELDS = ("id", "name", "country", "city", "created_at")
+
 
 @admin_bp.get("/users")
 @admin_required
 def list_users():
-    users = User.query.order_by(User.created_at.desc()).all()
-    return jsonify({"users": [user.to_dict() for user in users]})
+    # Fetch only the exposed columns (not password_hash) and stream the rows
+    users = (
+        User.query.options(load_only(*(getattr(User, f) for f in _USER_FIELDS)))
+        .order_by(User.created_at.desc())
+        .yield_per(500)
+    )
+    return jsonify({"users": serialize_rows(users, _USER_FIELDS)})
 
 
 @admin_bp.post("/facilities")
@@ -42,6 +54,7 @@ def create_facility():
     facility = Facility(name=name, country=country, city=city)
     db.session.add(facility)
     db.session.commit()
+    bump_reports_version()
 
     return jsonify({"facility": facility.to_dict()}), 201
 
@@ -49,8 +62,13 @@ def create_facility():
 @admin_bp.get("/facilities")
 @admin_required
 def list_facilities():
-    facilities = Facility.query.order_by(Facility.name.asc()).all()
-    return jsonify({"facilities": [facility.to_dict() for facility in facilities]})
+    facilities = (
+        Facility.query.options(
+            load_only(*(getattr(Facility, f) for f in _FACILITY_FIELDS)))
+        .order_by(Facility.name.asc())
+        .yield_per(500)
+    )
+    return jsonify({"facilities": serialize_rows(facilities, _FACILITY_FIELDS)})
 
 
 @admin_bp.post("/users")
@@ -102,4 +120,5 @@ def delete_facility(facility_id: int):
 
     db.session.delete(facility)
     db.session.commit()
+    bump_reports_version()
     return jsonify({"message": "Facility deleted."})
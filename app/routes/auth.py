@@ -9,7 +9,7 @@ from flask_jwt_extended import (
 )
 from sqlalchemy.exc import IntegrityError
 
-from ..extensions import db, jwt
+from ..extensions import db, jwt, token_blocklist
 from ..models import Facility, User, UserRole
 from ..utils.validators import (
     sanitize_email,
@@ -19,12 +19,12 @@ from ..utils.validators import (
 )
 
 auth_bp = Blueprint("auth", __name__)
-revoked_tokens: set[str] = set()
 
 
 @jwt.token_in_blocklist_loader
 def is_token_revoked(jwt_header, jwt_payload):
-    return jwt_payload.get("jti") in revoked_tokens
+    jti = jwt_payload.get("jti")
+    return jti is not None and jti in token_blocklist
 
 
 @auth_bp.post("/register")
@@ -107,6 +107,5 @@ def login():
 def logout():
     jti = get_jwt().get("jti")
     if jti:
-        revoked_tokens.add(jti)
-    # Placeholder: persist revocation list (e.g., Redis/DB) in production.
+        token_blocklist.add(jti)
     return jsonify({"message": "Logged out"}), 200
@@ -1,66 +1,78 @@
 """Monitor routes."""
-from datetime import datetime, timedelta
+import threading
 
-from flask import Blueprint, jsonify, request
-from sqlalchemy import and_, func
+import orjson
+from cachetools import TTLCache
+from flask import Blueprint, Response, current_app, jsonify, request
+from sqlalchemy import select
 
 from ..extensions import db
 from ..models import Facility, ResourceReport
+from ..utils.cache import reports_version
 from ..utils.decorators import monitor_required
+from ..utils.sql import utc_days_ago
 
 monitor_bp = Blueprint("monitor", __name__)
 
+# Encoded /dashboard bodies keyed by (app, reports version). Writes in this
+# process bump the version; the TTL bounds staleness from other workers.
+DASHBOARD_CACHE_TTL = 30
+_dashboard_cache = TTLCache(maxsize=4, ttl=DASHBOARD_CACHE_TTL)
+_dashboard_cache_lock = threading.Lock()
+
 
 @monitor_bp.get("/dashboard")
 @monitor_required
 def dashboard_summary():
-    facilities = Facility.query.order_by(Facility.name.asc()).all()
-
-    latest_subq = (
-        db.session.query(
-            ResourceReport.facility_id,
-            func.max(ResourceReport.updated_at).label("latest_ts"),
-        )
-        .group_by(ResourceReport.facility_id)
-        .subquery()
-    )
-
-    latest_reports = (
-        db.session.query(ResourceReport)
-        .join(
-            latest_subq,
-            and_(
-                ResourceReport.facility_id == latest_subq.c.facility_id,
-                ResourceReport.updated_at == latest_subq.c.latest_ts,
-            ),
+    cache_key = (id(current_app._get_current_object()), reports_version())
+    with _dashboard_cache_lock:
+        body = _dashboard_cache.get(cache_key)
+    if body is None:
+        body = orjson.dumps({"facilities": _build_dashboard_summary()})
+        with _dashboard_cache_lock:
+            _dashboard_cache[cache_key] = body
+    return Response(body, mimetype="application/json")
+
+
+def _build_dashboard_summary() -> list[dict]:
+    # uq_reports_facility_id guarantees at most one snapshot row per
+    # facility (create_report upserts on it), so a plain outer join yields
+    # one row per facility with no per-request "latest" aggregation. Do not
+    # drop that constraint without restoring a latest-row subquery here.
+    rows = db.session.execute(
+        select(
+            Facility.id,
+            Facility.name,
+            Facility.country,
+            Facility.city,
+            ResourceReport.icu_beds_available,
+            ResourceReport.ventilators_available,
+            ResourceReport.staff_on_duty,
+            ResourceReport.updated_at,
         )
-        .all()
+        .outerjoin(ResourceReport, ResourceReport.facility_id == Facility.id)
+        .order_by(Facility.name.asc())
     )
-    latest_by_facility = {r.facility_id: r for r in latest_reports}
-
-    def loc_string(fac: Facility) -> str | None:
-        parts = [p for p in [fac.city, fac.country] if p]
-        return ", ".join(parts) if parts else None
 
     summary = []
-    for fac in facilities:
-        report = latest_by_facility.get(fac.id)
+    for row in rows:
+        parts = [p for p in [row.city, row.country] if p]
         summary.append(
             {
-                "facility_id": fac.id,
-                "facility_name": fac.name,
-                "country": fac.country,
-                "city": fac.city,
-                "location": loc_string(fac),
-                "icu_beds_available": getattr(report, "icu_beds_available", None),
-                "ventilators_available": getattr(report, "ventilators_available", None),
-                "staff_on_duty": getattr(report, "staff_on_duty", None),
-                "last_update": report.updated_at.isoformat() if report else None,
-                "critical": bool(report and report.icu_beds_available == 0),
+                "facility_id": row.id,
+                "facility_name": row.name,
+                "country": row.country,
+                "city": row.city,
+                "location": ", ".join(parts) if parts else None,
+                "icu_beds_available": row.icu_beds_available,
+                "ventilators_available": row.ventilators_available,
+                "staff_on_duty": row.staff_on_duty,
+                "last_update": row.updated_at.isoformat() if row.updated_at else None,
+                "critical": row.icu_beds_available == 0,
             }
         )
 
-    return jsonify({"facilities": summary})
+    return summary
 
 
 @monitor_bp.get("/dashboard/history")
@@ -78,13 +90,21 @@ def dashboard_history():
     if not facility:
         return jsonify({"error": "Facility not found."}), 404
 
-    since = datetime.utcnow() - timedelta(days=days)
-    reports = (
-        ResourceReport.query.filter_by(facility_id=facility_id)
-        .filter(ResourceReport.updated_at >= since)
+    # Plain column rows instead of ORM objects; the JSON provider encodes
+    # the datetimes directly, so there is no per-row to_dict()/isoformat().
+    reports = db.session.execute(
+        select(
+            ResourceReport.id,
+            ResourceReport.facility_id,
+            ResourceReport.icu_beds_available,
+            ResourceReport.ventilators_available,
+            ResourceReport.staff_on_duty,
+            ResourceReport.updated_at,
+        )
+        .where(ResourceReport.facility_id == facility_id,
+               ResourceReport.updated_at >= utc_days_ago(days))
         .order_by(ResourceReport.updated_at.asc())
-        .all()
-    )
+    ).mappings()
 
     return jsonify(
         {
@@ -95,6 +115,6 @@ def dashboard_history():
                 "city": facility.city,
             },
             "days": days,
-            "reports": [report.to_dict() for report in reports],
+            "reports": [dict(report) for report in reports],
         }
     )
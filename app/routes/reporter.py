@@ -1,43 +1,31 @@
 """Reporter routes."""
-import json
+from datetime import datetime
 
 from flask import Blueprint, jsonify, request
-from flask_jwt_extended import get_jwt_identity
+from sqlalchemy.orm import raiseload
 
 from ..extensions import db
 from ..models import Facility, ResourceReport
-from ..utils.decorators import reporter_required
-from ..utils.validators import sanitize_integer, validate_report_payload
+from ..utils.cache import bump_reports_version
+from ..utils.decorators import get_identity, reporter_required
+from ..utils.sql import insert_on_conflict
+from ..utils.validators import decode_report_payload
 
 reporter_bp = Blueprint("reporter", __name__)
 
 
-def _parse_identity():
-    """Parse JWT identity, handling both dict and JSON string formats."""
-    identity = get_jwt_identity()
-    if isinstance(identity, str):
-        try:
-            return json.loads(identity)
-        except (json.JSONDecodeError, TypeError):
-            return {}
-    return identity or {}
-
-
 @reporter_bp.post("/reports")
 @reporter_required
 def create_report():
-    identity = _parse_identity()
+    identity = get_identity()
     role = identity.get("role")
     reporter_facility_id = identity.get("facility_id")
-    data = request.get_json() or {}
 
-    errors = validate_report_payload(data)
+    payload, errors = decode_report_payload(request.get_data())
     if errors:
         return jsonify({"errors": errors}), 400
 
-    facility_id = sanitize_integer(data.get("facility_id"), min_val=1)
-    if facility_id is None:
-        return jsonify({"error": "Invalid facility_id."}), 400
+    facility_id = payload.facility_id
 
     if role == "reporter":
         if not reporter_facility_id:
@@ -45,42 +33,38 @@ def create_report():
         if reporter_facility_id != facility_id:
             return jsonify({"error": "Reporter can only submit for their facility."}), 403
 
-    facility = Facility.query.get(facility_id)
-    if not facility:
+    # Existence probe only; no need to load the facility row
+    facility_exists = db.session.query(
+        Facility.query.filter_by(id=facility_id).exists()).scalar()
+    if not facility_exists:
         return jsonify({"error": "Facility not found."}), 404
 
-    # Sanitize resource values
-    icu_beds = sanitize_integer(
-        data.get("icu_beds_available"), min_val=0, max_val=10000)
-    ventilators = sanitize_integer(
-        data.get("ventilators_available"), min_val=0, max_val=10000)
-    staff = sanitize_integer(data.get("staff_on_duty"),
-                             min_val=0, max_val=10000)
-
-    # Upsert: overwrite latest snapshot for this facility.
-    report = ResourceReport.query.filter_by(facility_id=facility_id).first()
-    payload = {
-        "icu_beds_available": icu_beds,
-        "ventilators_available": ventilators,
-        "staff_on_duty": staff,
+    # Upsert: overwrite latest snapshot for this facility in one atomic
+    # INSERT ... ON CONFLICT (facility_id) DO UPDATE.
+    values = {
+        "icu_beds_available": payload.icu_beds_available,
+        "ventilators_available": payload.ventilators_available,
+        "staff_on_duty": payload.staff_on_duty,
+        "updated_at": datetime.utcnow(),
     }
-
-    if report:
-        for field, value in payload.items():
-            setattr(report, field, value)
-    else:
-        report = ResourceReport(facility_id=facility_id, **payload)
-        db.session.add(report)
-
+    stmt = (
+        insert_on_conflict(ResourceReport)
+        .values(facility_id=facility_id, **values)
+        .on_conflict_do_update(index_elements=["facility_id"], set_=values)
+        .returning(ResourceReport)
+    )
+    report = db.session.scalars(stmt).one()
+    report_data = report.to_dict()
     db.session.commit()
+    bump_reports_version()
 
-    return jsonify({"report": report.to_dict()}), 201
+    return jsonify({"report": report_data}), 201
 
 
 @reporter_bp.get("/reports/me")
 @reporter_required
 def get_my_latest_report():
-    identity = _parse_identity()
+    identity = get_identity()
     role = identity.get("role")
     facility_id = identity.get("facility_id")
 
@@ -93,9 +77,10 @@ def get_my_latest_report():
         if not facility_id:
             return jsonify({"error": "facility_id is required for this request."}), 400
 
+    # to_dict() reads columns only; any relationship access should fail loudly
     report = (
-        ResourceReport.query.filter_by(facility_id=facility_id)
-        .order_by(ResourceReport.updated_at.desc())
+        ResourceReport.query.options(raiseload("*"))
+        .filter_by(facility_id=facility_id)
         .first()
     )
     if not report:
@@ -1,12 +1,56 @@
 """Seed helpers for the application."""
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
 import click
+from sqlalchemy import insert, select
 
 from .extensions import db
-from .models import User, Facility
+from .models import User, UserRole, Facility
+from .models.user import hash_password
+from .utils.sql import insert_on_conflict
+
+DEFAULT_ADMIN_EMAIL = "admin@example.com"
+
+
+@lru_cache(maxsize=4)
+def _default_admin_hash(method: str | None) -> str:
+    """Hash the bootstrap admin password once per process and method."""
+    return hash_password("Admin@123", method)
+
+
+def init_database(app):
+    """Create all tables and the default admin user if missing."""
+    db.create_all()
+    # A single INSERT ... ON CONFLICT avoids the SELECT round trip and
+    # races between concurrent boots.
+    now = datetime.utcnow()
+    result = db.session.execute(
+        insert_on_conflict(User.__table__)
+        .values(
+            email=DEFAULT_ADMIN_EMAIL,
+            password_hash=_default_admin_hash(
+                app.config.get("SEED_PASSWORD_HASH_METHOD")),
+            role=UserRole.ADMIN,
+            created_at=now,
+            updated_at=now,
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+    )
+    db.session.commit()
+    if result.rowcount:
+        app.logger.info("Created default admin user: %s", DEFAULT_ADMIN_EMAIL)
 
 
 def register_seed_commands(app):
+    @app.cli.command("db-init")
+    def db_init():
+        """Create tables and the default admin user (run once per deploy)."""
+        init_database(app)
+        app.logger.info("Database initialized")
+
     @app.cli.command("seed-admin")
     @click.option("--email", default=None, help="Admin email address")
     @click.option("--password", default=None, help="Admin password")
@@ -44,31 +88,35 @@ def register_seed_commands(app):
                 "country": "Australia", "city": "Sydney"},
         ]
 
-        created_count = 0
+        existing_names = set(db.session.scalars(
+            select(Facility.name).where(
+                Facility.name.in_([f["name"] for f in facilities_data]))))
+
+        # Collected as plain rows and written with one executemany INSERT
+        new_rows = []
         for fac_data in facilities_data:
-            existing = Facility.query.filter_by(name=fac_data["name"]).first()
-            if existing:
+            if fac_data["name"] in existing_names:
                 app.logger.info("Facility already exists: %s",
                                 fac_data["name"])
                 continue
 
-            facility = Facility(**fac_data)
-            db.session.add(facility)
-            created_count += 1
+            new_rows.append(fac_data)
             app.logger.info("Created facility: %s", fac_data["name"])
 
-        if created_count > 0:
+        if new_rows:
+            db.session.execute(insert(Facility), new_rows)
             db.session.commit()
-            app.logger.info("Created %d facilities", created_count)
+            app.logger.info("Created %d facilities", len(new_rows))
         else:
             app.logger.info("No new facilities created")
 
     @app.cli.command("seed-users")
     def seed_users():
         """Seed sample REPORTER and MONITOR users."""
-        # First ensure we have facilities
-        facilities = Facility.query.all()
-        if not facilities:
+        # First ensure we have facilities; one query resolves every name
+        facility_map = dict(db.session.execute(
+            select(Facility.name, Facility.id)).all())
+        if not facility_map:
             app.logger.warning(
                 "No facilities found. Please run 'flask seed-facilities' first.")
             return
@@ -106,20 +154,21 @@ def register_seed_commands(app):
             },
         ]
 
-        created_count = 0
+        existing_emails = set(db.session.scalars(
+            select(User.email).where(
+                User.email.in_([u["email"] for u in users_data]))))
+        method = app.config.get("PASSWORD_HASH_METHOD")
+
+        pending = []
         for user_data in users_data:
-            existing = User.query.filter_by(email=user_data["email"]).first()
-            if existing:
+            if user_data["email"] in existing_emails:
                 app.logger.info("User already exists: %s", user_data["email"])
                 continue
 
             facility_id = None
             if user_data["facility_name"]:
-                facility = Facility.query.filter_by(
-                    name=user_data["facility_name"]).first()
-                if facility:
-                    facility_id = facility.id
-                else:
+                facility_id = facility_map.get(user_data["facility_name"])
+                if facility_id is None:
                     app.logger.warning(
                         "Facility '%s' not found for user %s",
                         user_data["facility_name"],
@@ -127,20 +176,30 @@ def register_seed_commands(app):
                     )
                     continue
 
-            user = User(
-                email=user_data["email"],
-                role=user_data["role"],
-                facility_id=facility_id
-            )
-            user.set_password(user_data["password"])
-            db.session.add(user)
-            created_count += 1
+            pending.append((user_data, facility_id))
+
+        # argon2 releases the GIL while hashing, so threads use every core
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            hashes = list(pool.map(
+                lambda item: hash_password(item[0]["password"], method),
+                pending))
+
+        # Collected as plain rows and written with one executemany INSERT
+        new_rows = []
+        for (user_data, facility_id), password_hash in zip(pending, hashes):
+            new_rows.append({
+                "email": user_data["email"],
+                "password_hash": password_hash,
+                "role": UserRole(user_data["role"]),
+                "facility_id": facility_id,
+            })
             app.logger.info("Created %s user: %s",
                             user_data["role"], user_data["email"])
 
-        if created_count > 0:
+        if new_rows:
+            db.session.execute(insert(User), new_rows)
             db.session.commit()
-            app.logger.info("Created %d users", created_count)
+            app.logger.info("Created %d users", len(new_rows))
         else:
             app.logger.info("No new users created")
 
@@ -0,0 +1,17 @@
+"""In-process cache invalidation helpers."""
+import threading
+
+_lock = threading.Lock()
+_reports_version = 0
+
+
+def reports_version() -> int:
+    """Return the current dashboard data version for this process."""
+    return _reports_version
+
+
+def bump_reports_version() -> None:
+    """Invalidate cached dashboard data after reports or facilities change."""
+    global _reports_version
+    with _lock:
+        _reports_version += 1
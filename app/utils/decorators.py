@@ -1,33 +1,46 @@
 """Custom decorators for role-based access control."""
 from __future__ import annotations
 
-import json
 from functools import wraps
 from typing import Iterable
 
-from flask import jsonify
+import orjson
+from flask import g, jsonify
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 
 
+_ADMIN = frozenset(("admin",))
+# Admins can act on reporter and monitor endpoints for oversight/support.
+_REPORTER = frozenset(("reporter", "admin"))
+_MONITOR = frozenset(("monitor", "admin"))
+
+
 def _get_identity_dict():
     """Parse JWT identity, handling both dict and JSON string formats."""
     identity = get_jwt_identity()
     if isinstance(identity, str):
         try:
-            return json.loads(identity)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(identity)
+        except (orjson.JSONDecodeError, TypeError):
             return {}
     return identity or {}
 
 
+def get_identity() -> dict:
+    """Return the JWT identity parsed by the role guard for this request."""
+    return g.identity
+
+
 def _role_guard(allowed_roles: Iterable[str]):
-    allowed = set(allowed_roles)
+    allowed = frozenset(allowed_roles)
 
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
             verify_jwt_in_request()
-            identity = _get_identity_dict()
+            # Always re-parse: ``g`` lives on the app context, which may
+            # span several requests (e.g. a test client inside one context).
+            identity = g.identity = _get_identity_dict()
             if identity.get("role") not in allowed:
                 return jsonify({"error": "Forbidden"}), 403
             return fn(*args, **kwargs)
@@ -43,14 +56,12 @@ def role_required(roles: Iterable[str]):
 
 
 def admin_required(fn):
-    return _role_guard({"admin"})(fn)
+    return _role_guard(_ADMIN)(fn)
 
 
 def reporter_required(fn):
-    # Admins can act on reporter endpoints for oversight/support.
-    return _role_guard({"reporter", "admin"})(fn)
+    return _role_guard(_REPORTER)(fn)
 
 
 def monitor_required(fn):
-    # Admins can act on monitor endpoints as well.
-    return _role_guard({"monitor", "admin"})(fn)
+    return _role_guard(_MONITOR)(fn)
@@ -0,0 +1,50 @@
+"""JSON serialization helpers."""
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Iterable, Sequence
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+
+def serialize_rows(rows: Iterable[Any], fields: Sequence[str]) -> list[dict]:
+    """Build plain dicts from model rows.
+
+    Args:
+        rows: Model instances (or any objects) to serialize
+        fields: Attribute names to read; at least two
+
+    Returns:
+        One dict per row; datetimes are left for orjson to encode
+    """
+    getter = attrgetter(*fields)
+    return [dict(zip(fields, getter(row))) for row in rows]
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Output matches the default provider for the types this API returns;
+    ``default`` is still consulted for types orjson can't encode (Decimal,
+    objects with ``__html__``). Output is always compact.
+    """
+
+    def _option(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default,
+                            option=self._option()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._option())
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,50 @@
+"""Dialect-aware SQL helpers."""
+from __future__ import annotations
+
+from sqlalchemy import DateTime, Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+from ..extensions import db
+
+
+def insert_on_conflict(table: Table):
+    """Return an INSERT construct supporting ON CONFLICT for the active dialect.
+
+    Args:
+        table: Table (or mapped class) to insert into
+
+    Returns:
+        PostgreSQL or SQLite ``Insert`` with ``on_conflict_do_*`` methods
+    """
+    dialect = db.engine.dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"ON CONFLICT is not supported on {dialect}")
+
+
+class utc_days_ago(FunctionElement):
+    """Naive UTC timestamp ``days`` days before the database's current time.
+
+    Keeps the cutoff on the database side so the statement text is fixed
+    and only the integer ``days`` is bound.
+    """
+
+    type = DateTime()
+    name = "utc_days_ago"
+    inherit_cache = True
+
+
+@compiles(utc_days_ago, "postgresql")
+def _utc_days_ago_postgresql(element, compiler, **kw):
+    days = compiler.process(element.clauses, **kw)
+    return f"(now() AT TIME ZONE 'utc') - make_interval(days => {days})"
+
+
+@compiles(utc_days_ago, "sqlite")
+def _utc_days_ago_sqlite(element, compiler, **kw):
+    days = compiler.process(element.clauses, **kw)
+    return f"datetime('now', '-' || {days} || ' days')"
@@ -1,6 +1,16 @@
 """Input validators and sanitizers."""
 import re
-from typing import Any, Dict, List
+import string
+from typing import Annotated, Any, Dict, List, Tuple
+
+import msgspec
+
+# Character classes for the simplified RFC 5322 email check
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+# Characters stripped from email input
+_EMAIL_STRIP_RE = re.compile(r"[<>()\[\]{}|\\]")
 
 
 def sanitize_string(value: Any, max_length: int = 1000) -> str:
@@ -17,10 +27,11 @@ def sanitize_string(value: Any, max_length: int = 1000) -> str:
         return ""
 
     # Convert to string and strip whitespace
-    sanitized = str(value).strip()
+    sanitized = (value if type(value) is str else str(value)).strip()
 
-    # Remove null bytes
-    sanitized = sanitized.replace("\x00", "")
+    # Remove null bytes (the scan short-circuits; copy only when present)
+    if "\x00" in sanitized:
+        sanitized = sanitized.replace("\x00", "")
 
     # Truncate to max length
     if len(sanitized) > max_length:
@@ -45,13 +56,17 @@ def sanitize_email(email: Any) -> str:
     sanitized = sanitize_string(email, max_length=255).lower()
 
     # Remove any dangerous characters
-    sanitized = re.sub(r"[<>()\[\]{}|\\]", "", sanitized)
+    sanitized = _EMAIL_STRIP_RE.sub("", sanitized)
 
     return sanitized
 
 
 def is_valid_email(email: str) -> bool:
-    """Validate email format using regex.
+    """Validate email format.
+
+    Accepts ``local@domain.tld`` where local is ``[a-zA-Z0-9._%+-]+``,
+    domain is ``[a-zA-Z0-9.-]+`` and tld is at least two letters. Checked
+    with a single linear pass per part, so it cannot backtrack.
 
     Args:
         email: Email address to validate
@@ -62,9 +77,16 @@ def is_valid_email(email: str) -> bool:
     if not email:
         return False
 
-    # RFC 5322 simplified email regex
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(email_pattern, email))
+    local, _, domain = email.partition("@")
+    host, _, tld = domain.rpartition(".")
+    return bool(
+        local
+        and host
+        and len(tld) >= 2
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+    )
 
 
 def sanitize_integer(value: Any, min_val: int | None = None, max_val: int | None = None) -> int | None:
@@ -81,18 +103,22 @@ def sanitize_integer(value: Any, min_val: int | None = None, max_val: int | None
     if value is None:
         return None
 
-    try:
-        num = int(value)
-
-        if min_val is not None and num < min_val:
-            return None
-        if max_val is not None and num > max_val:
+    # JSON payloads usually carry ints already; skip the constructor
+    if type(value) is int:
+        num = value
+    else:
+        try:
+            num = int(value)
+        except (TypeError, ValueError):
             return None
 
-        return num
-    except (TypeError, ValueError):
+    if min_val is not None and num < min_val:
+        return None
+    if max_val is not None and num > max_val:
         return None
 
+    return num
+
 
 def validate_user_payload(data: Dict, require_password: bool = True) -> List[str]:
     """Validate user creation/update payload.
@@ -129,6 +155,24 @@ def validate_user_payload(data: Dict, require_password: bool = True) -> List[str
     return errors
 
 
+# Report payload bounds, shared by the msgspec fast path and the fallback
+FACILITY_ID_MIN = 1
+RESOURCE_COUNT_MIN = 0
+RESOURCE_COUNT_MAX = 10000
+
+_ResourceCount = Annotated[
+    int, msgspec.Meta(ge=RESOURCE_COUNT_MIN, le=RESOURCE_COUNT_MAX)]
+
+
+class ReportPayload(msgspec.Struct):
+    """Resource report payload, decoded and bounds-checked in one pass."""
+
+    facility_id: Annotated[int, msgspec.Meta(ge=FACILITY_ID_MIN)]
+    icu_beds_available: _ResourceCount
+    ventilators_available: _ResourceCount
+    staff_on_duty: _ResourceCount
+
+
 def validate_report_payload(data: Dict) -> List[str]:
     """Validate resource report payload.
 
@@ -141,7 +185,8 @@ def validate_report_payload(data: Dict) -> List[str]:
     errors: List[str] = []
 
     # Validate facility_id
-    facility_id = sanitize_integer(data.get("facility_id"), min_val=1)
+    facility_id = sanitize_integer(
+        data.get("facility_id"), min_val=FACILITY_ID_MIN)
     if facility_id is None:
         if data.get("facility_id") is None:
             errors.append("facility_id is required.")
@@ -155,17 +200,60 @@ def validate_report_payload(data: Dict) -> List[str]:
             errors.append(f"{field} is required.")
             continue
 
-        sanitized = sanitize_integer(value, min_val=0, max_val=10000)
+        sanitized = sanitize_integer(
+            value, min_val=RESOURCE_COUNT_MIN, max_val=RESOURCE_COUNT_MAX)
         if sanitized is None:
             if str(value).strip() == "":
                 errors.append(f"{field} is required.")
             else:
                 errors.append(
-                    f"{field} must be a non-negative integer (max 10000).")
+                    f"{field} must be a non-negative integer (max {RESOURCE_COUNT_MAX}).")
 
     return errors
 
 
+def decode_report_payload(raw: bytes) -> Tuple[ReportPayload | None, List[str]]:
+    """Decode and validate a resource report JSON body.
+
+    Well-formed bodies with plain JSON integers are decoded and
+    bounds-checked by msgspec in one call. Anything else falls back to
+    validate_report_payload, so every error is reported with the usual
+    messages and numeric strings are coerced as before.
+
+    Args:
+        raw: Raw request body
+
+    Returns:
+        Tuple of (payload, errors); payload is None when errors is non-empty
+    """
+    try:
+        return msgspec.json.decode(raw, type=ReportPayload), []
+    except msgspec.ValidationError:
+        pass
+    except msgspec.DecodeError:
+        return None, ["Request body must be valid JSON."]
+
+    try:
+        data = msgspec.json.decode(raw) or {}
+    except msgspec.MsgspecError:
+        # e.g. numbers too large to decode at all
+        return None, ["Request body must be valid JSON."]
+    if not isinstance(data, dict):
+        return None, ["Request body must be a JSON object."]
+
+    errors = validate_report_payload(data)
+    if errors:
+        return None, errors
+
+    # Already bounds-checked above; only the coercion is left to apply
+    return ReportPayload(
+        facility_id=sanitize_integer(data["facility_id"]),
+        icu_beds_available=sanitize_integer(data["icu_beds_available"]),
+        ventilators_available=sanitize_integer(data["ventilators_available"]),
+        staff_on_duty=sanitize_integer(data["staff_on_duty"]),
+    ), []
+
+
 def validate_facility_payload(data: Dict) -> List[str]:
     """Validate facility creation/update payload.
 
@@ -1,5 +1,11 @@
-"""Script to query and display database tables and data."""
+"""Script to query and display database tables and data.
+
+Pass ``--csv`` to dump each table as CSV via COPY instead of printing rows.
+"""
+import sys
+
 import psycopg2
+from psycopg2 import sql
 
 # Connect to the database
 conn = psycopg2.connect(
@@ -9,6 +15,10 @@ conn = psycopg2.connect(
     password="0000"
 )
 
+# Rows fetched per round trip from the server-side cursor
+BATCH_SIZE = 1000
+dump_csv = "--csv" in sys.argv[1:]
+
 cur = conn.cursor()
 
 # Get all tables
@@ -34,29 +44,31 @@ for table in tables:
     print(f"📊 TABLE: {table_name.upper()}")
     print("=" * 70)
 
-    # Get column names
-    cur.execute(f"""
-        SELECT column_name, data_type 
-        FROM information_schema.columns 
-        WHERE table_name = '{table_name}' 
-        ORDER BY ordinal_position
-    """)
-    columns_info = cur.fetchall()
-    columns = [col[0] for col in columns_info]
+    if dump_csv:
+        cur.copy_expert(
+            sql.SQL("COPY {} TO STDOUT WITH CSV HEADER").format(
+                sql.Identifier(table_name)),
+            sys.stdout)
+        print()
+        continue
 
-    print(f"Columns: {', '.join(columns)}")
-    print("-" * 70)
+    # Stream through a named (server-side) cursor so large tables are
+    # never held in memory; description is only set after the first fetch.
+    with conn.cursor(name="stream") as stream:
+        stream.execute(sql.SQL("SELECT * FROM {}").format(
+            sql.Identifier(table_name)))
+        rows = stream.fetchmany(BATCH_SIZE)
+        columns = [col.name for col in stream.description]
 
-    # Get data
-    cur.execute(f"SELECT * FROM {table_name}")
-    rows = cur.fetchall()
+        print(f"Columns: {', '.join(columns)}")
+        print("-" * 70)
 
-    if rows:
-        for row in rows:
-            row_dict = dict(zip(columns, row))
-            print(row_dict)
-    else:
-        print("(No data)")
+        if not rows:
+            print("(No data)")
+        while rows:
+            for row in rows:
+                print(dict(zip(columns, row)))
+            rows = stream.fetchmany(BATCH_SIZE)
     print()
 
 cur.close()